@@ -17,7 +17,7 @@ from nautilus_trader.trading.strategy import Strategy
 from config import SYMBOLS, HYPERLIQUID_VENUE, BINANCE_VENUE
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Container for price data from different venues."""
     instrument: str
@@ -27,7 +27,7 @@ class PriceData:
     timestamp: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Container for arbitrage opportunity data."""
     instrument: str
@@ -74,6 +74,25 @@ class ArbitrageStrategy(Strategy):
                 "BINANCE": PriceData(instrument, "BINANCE")
             }
 
+        # InstrumentId per instrument and venue, built once instead of per subscription/order
+        self._instrument_ids: Dict[str, Dict[str, InstrumentId]] = {
+            instrument: {
+                venue: InstrumentId(symbol=Symbol(instrument), venue=Venue(venue))
+                for venue in venue_data
+            }
+            for instrument, venue_data in self.price_data.items()
+        }
+
+        # Same PriceData objects keyed by InstrumentId, so tick updates skip the symbol/venue value lookups
+        self._price_data_by_id: Dict[InstrumentId, PriceData] = {
+            self._instrument_ids[instrument][venue]: price_data
+            for instrument, venue_data in self.price_data.items()
+            for venue, price_data in venue_data.items()
+        }
+
+        # Parsed order quantity per trade size computed by _calculate_trade_quantity
+        self._trade_quantities: Dict[float, Quantity] = {}
+
         # Risk management
         self.active_positions: Dict[str, Dict[str, Decimal]] = {}
         self.last_risk_check = 0
@@ -97,7 +116,7 @@ class ArbitrageStrategy(Strategy):
                 BINANCE_VENUE: Decimal("0")
             }
             for venue in [HYPERLIQUID_VENUE, BINANCE_VENUE]:
-                instrument_id = InstrumentId(symbol=Symbol(instrument), venue=Venue(venue))
+                instrument_id = self._instrument_ids[instrument][venue]
                 self.log.info(f"Subscribing to {instrument_id}")
                 self.subscribe_quote_ticks(instrument_id, ClientId("JUST-PPE-STRATEGY"))
 
@@ -120,18 +139,15 @@ class ArbitrageStrategy(Strategy):
 
     def _update_price_data(self, price_info: QuoteTick) -> None:
         """Update internal price data storage."""
-        instrument = price_info.instrument_id.symbol.value
-        venue = price_info.instrument_id.venue.value
-
-        if instrument not in self.price_data or venue not in self.price_data[instrument]:
+        price_data = self._price_data_by_id.get(price_info.instrument_id)
+        if price_data is None:
             return
 
-        price_data = self.price_data[instrument][venue]
         price_data.bid = price_info.bid_price
         price_data.ask = price_info.ask_price
         price_data.timestamp = price_info.ts_event
 
-        self.log.debug(f"Updated {venue} {instrument}: bid={price_data.bid}, ask={price_data.ask}")
+        self.log.debug(f"Updated {price_data.venue} {price_data.instrument}: bid={price_data.bid}, ask={price_data.ask}")
 
     def _check_arbitrage_opportunities(self) -> None:
         """Check for arbitrage opportunities across all instruments."""
@@ -142,15 +158,17 @@ class ArbitrageStrategy(Strategy):
             self._perform_risk_check()
             self.last_risk_check = current_time
 
+        # one clock read for the whole scan - freshness is checked in whole seconds anyway
+        current_time_s = current_time // 1_000_000_000
         for instrument in self.instruments:
-            opportunity = self._calculate_arbitrage_opportunity(instrument)
-            if opportunity and opportunity.profit_pct >= self.profit_threshold:
+            opportunity = self._calculate_arbitrage_opportunity(instrument, current_time_s)
+            if opportunity is not None:
                 self.opportunities_found += 1
                 self.log.info(f"Arbitrage opportunity found: {opportunity}")
                 self._execute_arbitrage_trade(opportunity)
 
-    def _calculate_arbitrage_opportunity(self, instrument: str) -> Optional[ArbitrageOpportunity]:
-        """Calculate arbitrage opportunity for a specific instrument."""
+    def _calculate_arbitrage_opportunity(self, instrument: str, current_time: int) -> Optional[ArbitrageOpportunity]:
+        """Calculate the tradeable arbitrage opportunity for a specific instrument, if any."""
         hyperliquid_data = self.price_data[instrument]["HYPERLIQUID"]
         binance_data = self.price_data[instrument]["BINANCE"]
 
@@ -161,46 +179,40 @@ class ArbitrageStrategy(Strategy):
         ]):
             return None
 
-        # Check data freshness (within last 10 seconds)
-        current_time = self.clock.timestamp_ns() // 1_000_000_000  # Convert to seconds
+        # Check data freshness (within last 10 seconds), current_time is in seconds
         if hyperliquid_data.timestamp and (current_time - hyperliquid_data.timestamp) > 10:
             return None
         if binance_data.timestamp and (current_time - binance_data.timestamp) > 10:
             return None
 
-        # Calculate opportunities in both directions
-        opportunities = []
-
-        # Buy from Hyperliquid, sell to Binance
-        if hyperliquid_data.ask and binance_data.bid:
-            profit_pct = (binance_data.bid - hyperliquid_data.ask) / hyperliquid_data.ask
-            if profit_pct > 0:
-                opportunities.append(ArbitrageOpportunity(
-                    instrument=instrument,
-                    buy_venue="HYPERLIQUID",
-                    sell_venue="BINANCE",
-                    buy_price=hyperliquid_data.ask,
-                    sell_price=binance_data.bid,
-                    profit_pct=profit_pct,
-                    max_quantity=min(1000.0, self.max_position_size)  # Simplified
-                ))
-
-        # Buy from Binance, sell to Hyperliquid
-        if binance_data.ask and hyperliquid_data.bid:
-            profit_pct = (hyperliquid_data.bid - binance_data.ask) / binance_data.ask
-            if profit_pct > 0:
-                opportunities.append(ArbitrageOpportunity(
-                    instrument=instrument,
-                    buy_venue="BINANCE",
-                    sell_venue="HYPERLIQUID",
-                    buy_price=binance_data.ask,
-                    sell_price=hyperliquid_data.bid,
-                    profit_pct=profit_pct,
-                    max_quantity=min(1000.0, self.max_position_size)  # Simplified
-                ))
-
-        # Return the most profitable opportunity
-        return max(opportunities, key=lambda x: x.profit_pct) if opportunities else None
+        # Profit in both directions - only the more profitable one can be traded
+        buy_hyperliquid_pct = (binance_data.bid - hyperliquid_data.ask) / hyperliquid_data.ask
+        buy_binance_pct = (hyperliquid_data.bid - binance_data.ask) / binance_data.ask
+
+        if buy_hyperliquid_pct >= buy_binance_pct:
+            # Buy from Hyperliquid, sell to Binance
+            profit_pct = buy_hyperliquid_pct
+            buy_venue, sell_venue = "HYPERLIQUID", "BINANCE"
+            buy_price, sell_price = hyperliquid_data.ask, binance_data.bid
+        else:
+            # Buy from Binance, sell to Hyperliquid
+            profit_pct = buy_binance_pct
+            buy_venue, sell_venue = "BINANCE", "HYPERLIQUID"
+            buy_price, sell_price = binance_data.ask, hyperliquid_data.bid
+
+        # Threshold check happens here, so opportunities that won't be traded are never built
+        if profit_pct <= 0 or profit_pct < self.profit_threshold:
+            return None
+
+        return ArbitrageOpportunity(
+            instrument=instrument,
+            buy_venue=buy_venue,
+            sell_venue=sell_venue,
+            buy_price=buy_price,
+            sell_price=sell_price,
+            profit_pct=profit_pct,
+            max_quantity=min(1000.0, self.max_position_size)  # Simplified
+        )
 
     def _execute_arbitrage_trade(self, opportunity: ArbitrageOpportunity) -> None:
         """Execute arbitrage trade."""
@@ -216,19 +228,20 @@ class ArbitrageStrategy(Strategy):
                 self.log.warning("Trade quantity too small, skipping")
                 return
 
-            self.log.info(f"Executing arbitrage trade: {opportunity.instrument}")
-            self.log.info(f"Buy {trade_quantity} on {opportunity.buy_venue} at {opportunity.buy_price}")
-            self.log.info(f"Sell {trade_quantity} on {opportunity.sell_venue} at {opportunity.sell_price}")
+            quantity = self._trade_quantities.get(trade_quantity)
+            if quantity is None:
+                quantity = self._trade_quantities[trade_quantity] = Quantity.from_str(str(trade_quantity))
 
-            # Create instrument IDs
-            buy_instrument_id = InstrumentId.from_str(f"{opportunity.instrument}.{opportunity.buy_venue}")
-            sell_instrument_id = InstrumentId.from_str(f"{opportunity.instrument}.{opportunity.sell_venue}")
+            # Look up instrument IDs
+            instrument_ids = self._instrument_ids[opportunity.instrument]
+            buy_instrument_id = instrument_ids[opportunity.buy_venue]
+            sell_instrument_id = instrument_ids[opportunity.sell_venue]
 
             # Create buy order
             buy_order = self.order_factory.market(
                 instrument_id=buy_instrument_id,
                 order_side=OrderSide.BUY,
-                quantity=Quantity.from_str(str(trade_quantity)),
+                quantity=quantity,
                 time_in_force=TimeInForce.IOC,
             )
 
@@ -236,17 +249,25 @@ class ArbitrageStrategy(Strategy):
             sell_order = self.order_factory.market(
                 instrument_id=sell_instrument_id,
                 order_side=OrderSide.SELL,
-                quantity=Quantity.from_str(str(trade_quantity)),
+                quantity=quantity,
                 time_in_force=TimeInForce.IOC,
             )
 
-            # Submit orders simultaneously
+            # Submit both legs back to back - logging waits until both are on their way
             self.submit_order(buy_order)
             self.submit_order(sell_order)
 
+            self.log.info(
+                f"Executed arbitrage trade: {opportunity.instrument} "
+                f"buy {trade_quantity} on {opportunity.buy_venue} at {opportunity.buy_price} "
+                f"sell {trade_quantity} on {opportunity.sell_venue} at {opportunity.sell_price}"
+            )
+
             # Update position tracking
-            self.active_positions[opportunity.instrument][opportunity.buy_venue] += Decimal(str(trade_quantity))
-            self.active_positions[opportunity.instrument][opportunity.sell_venue] -= Decimal(str(trade_quantity))
+            positions = self.active_positions[opportunity.instrument]
+            position_delta = quantity.as_decimal()
+            positions[opportunity.buy_venue] += position_delta
+            positions[opportunity.sell_venue] -= position_delta
 
             # Track performance
             self.trades_executed += 2  # Two orders
@@ -1,9 +1,8 @@
 import asyncio
-import json
-import ssl
+from collections import deque
 from typing import Any, Dict, Optional
 
-import certifi
+import orjson
 import websockets
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
@@ -16,9 +15,12 @@ from nautilus_trader.model.identifiers import InstrumentId, Venue, ClientId
 from nautilus_trader.model.objects import Price, Quantity
 
 from config import SYMBOLS, BINANCE_VENUE
+from tls import ssl_context
 
-ssl_context = ssl.create_default_context()
-ssl_context.load_verify_locations(certifi.where())
+FRAME_QUEUE_SIZE = 4096
+
+# ticker stream per configured symbol, joined into the connection URL path
+STREAM_PATH = "/".join(f"{symbol.lower()}usdt@ticker" for symbol in SYMBOLS)
 
 
 class BinanceLiveDataClientConfig(LiveDataClientConfig, frozen=True):
@@ -28,6 +30,20 @@ class BinanceLiveDataClientConfig(LiveDataClientConfig, frozen=True):
 
 
 class BinanceLiveDataClient(LiveMarketDataClient):
+    # LiveMarketDataClient still brings a __dict__, but our own hot attributes live in fixed slots
+    __slots__ = (
+        "_config",
+        "_websocket",
+        "_reconnect_task",
+        "_heartbeat_task",
+        "_msg_task",
+        "_inbound",
+        "_inbound_event",
+        "_dropped_frames",
+        "_processing_task",
+        "_symbol_meta",
+    )
+
     def __init__(
             self,
             loop: asyncio.AbstractEventLoop,
@@ -48,20 +64,40 @@ class BinanceLiveDataClient(LiveMarketDataClient):
         )
 
         self._config = config
-        self._websocket: Optional[websockets.WebSocketServerProtocol] = None
-        self._subscribed_symbols: set[str] = set()
+        self._websocket: Optional[websockets.ClientConnection] = None
         self._reconnect_task: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._msg_task: Optional[asyncio.Task] = None
+        # raw frames handed from the recv loop to the processing task; when full, the oldest frame is dropped
+        self._inbound: deque[bytes] = deque(maxlen=FRAME_QUEUE_SIZE)
+        self._inbound_event = asyncio.Event()
+        self._dropped_frames = 0  # overflow count, reported once per processing drain
+        self._processing_task: Optional[asyncio.Task] = None
+
+        # instrument id and msgbus topic per raw Binance symbol (e.g. AAVEUSDT),
+        # so the tick path doesn't have to strip, parse or format anything
+        self._symbol_meta: dict[str, tuple[InstrumentId, str]] = {
+            f"{symbol}USDT": (
+                InstrumentId.from_str(f"{symbol}.{BINANCE_VENUE}"),
+                f"data.quotes.{BINANCE_VENUE}.{symbol}",
+            )
+            for symbol in SYMBOLS
+        }
 
     async def _connect(self) -> None:
         try:
+            # a reconnect must not leave the previous connection's tasks running next to the new ones
+            await self._cancel_connection_tasks()
+
             self._log.info(f"Connecting to Binance WebSocket: {self._config.websocket_url}")
-            streams = [f"{symbol.lower()}usdt@ticker" for symbol in SYMBOLS]
-            stream_url = f"{self._config.websocket_url}/{'/'.join(streams)}"
-            self._websocket = await websockets.connect(stream_url, ssl=ssl_context)
+            stream_url = f"{self._config.websocket_url}/{STREAM_PATH}"
+            self._websocket = await websockets.connect(stream_url, ssl=ssl_context, compression=None)
             self._log.info("Connected to Binance WebSocket")
 
-            self._loop.create_task(self._handle_messages())
+            if not self._processing_task:
+                self._processing_task = self._loop.create_task(self._process_inbound())
+
+            self._msg_task = self._loop.create_task(self._handle_messages())
 
             if self._config.heartbeat_interval > 0:
                 self._heartbeat_task = self._loop.create_task(self._heartbeat())
@@ -71,8 +107,20 @@ class BinanceLiveDataClient(LiveMarketDataClient):
             raise
 
     async def _disconnect(self) -> None:
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        # the handler must be gone before close(), otherwise it sees ConnectionClosedOK and reconnects
+        await self._cancel_connection_tasks()
+
+        if self._processing_task:
+            self._processing_task.cancel()
+            self._processing_task = None
+
+        # frames from this session must not be published as fresh quotes after the next connect
+        self._inbound.clear()
+        self._inbound_event.clear()
 
         if self._websocket:
             await self._websocket.close()
@@ -80,24 +128,32 @@ class BinanceLiveDataClient(LiveMarketDataClient):
 
         self._log.info("Disconnected from Hyperliquid WebSocket")
 
-    async def _subscribe_to_all_mids(self) -> None:
-        if not self._websocket:
-            raise RuntimeError("WebSocket not connected")
-
-        subscribe_msg = {
-            "method": "subscribe",
-            "subscription": {
-                "type": "allMids"
-            }
-        }
+    async def _cancel_connection_tasks(self) -> None:
+        for task in (self._heartbeat_task, self._msg_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
-        await self._websocket.send(json.dumps(subscribe_msg))
-        self._log.info("Subscribed to allMids feed")
+        self._heartbeat_task = None
+        self._msg_task = None
 
     async def _handle_messages(self) -> None:
         try:
-            async for message in self._websocket:
-                await self._process_message(message)
+            websocket = self._websocket
+            inbound = self._inbound
+            while True:
+                # raw bytes - orjson parses them directly, no intermediate str decode;
+                # parsing and publishing happen in _process_inbound so recv is never held up by them
+                message = await websocket.recv(decode=False)
+                if len(inbound) == FRAME_QUEUE_SIZE:
+                    # processing is lagging behind - the deque drops the oldest frame on append;
+                    # counted, not logged - a warning per frame would slow the overloaded loop down even more
+                    self._dropped_frames += 1
+                inbound.append(message)
+                self._inbound_event.set()
         except websockets.exceptions.ConnectionClosed:
             self._log.warning("WebSocket connection closed")
             if not self._reconnect_task:
@@ -105,27 +161,42 @@ class BinanceLiveDataClient(LiveMarketDataClient):
         except Exception as e:
             self._log.error(f"Error handling messages: {e}")
 
-    async def _process_message(self, message: str) -> None:
+    async def _process_inbound(self) -> None:
+        inbound = self._inbound
+        while True:
+            await self._inbound_event.wait()
+            self._inbound_event.clear()
+            # drain everything received since the last wakeup, then publish it in one go
+            ticks: list[tuple[str, QuoteTick]] = []
+            while inbound:
+                self._process_message(inbound.popleft(), ticks)
+            self._publish_ticks(ticks)
+
+            if self._dropped_frames:
+                self._log.warning(f"Frame queue full, dropped {self._dropped_frames} oldest frames")
+                self._dropped_frames = 0
+
+    def _process_message(self, message: bytes, ticks: list[tuple[str, QuoteTick]]) -> None:
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
+            if isinstance(data, dict) and "data" in data:
+                data = data["data"]  # combined stream envelope
 
-            if "data" in data:
-                await self._handle_ticker_data(data["data"])
-            elif "s" in data:
-                await self._handle_ticker_data(data)
+            if "s" in data:
+                self._handle_ticker_data(data, ticks)
 
         except Exception as e:
             self._log.error(f"Error processing message: {e}")
 
-    async def _handle_ticker_data(self, ticker_data: Dict[str, Any]):
+    def _handle_ticker_data(self, ticker_data: Dict[str, Any], ticks: list[tuple[str, QuoteTick]]) -> None:
         try:
-            symbol = ticker_data.get("s").replace("USDT", "")  # Symbol
-            bid_price = Price.from_str(ticker_data.get("b", "0"))  # Best bid
-            ask_price = Price.from_str(ticker_data.get("a", "0"))  # Best ask
-            bid_qty = Quantity.from_str(ticker_data.get("B", "1"))  # Best bid qty
-            ask_qty = Quantity.from_str(ticker_data.get("A", "1"))  # Best ask qty
-
-            instrument_id = InstrumentId.from_str(symbol + "." + self.venue.value)
+            # Binance always sends these fields - a missing one is a KeyError, logged below
+            instrument_id, topic = self._symbol_meta[ticker_data["s"]]  # Symbol
+            bid_price = Price.from_str(ticker_data["b"])  # Best bid
+            ask_price = Price.from_str(ticker_data["a"])  # Best ask
+            bid_qty = Quantity.from_str(ticker_data["B"])  # Best bid qty
+            ask_qty = Quantity.from_str(ticker_data["A"])  # Best ask qty
+            ts = self._clock.timestamp_ns()
 
             quote_tick = QuoteTick(
                 instrument_id=instrument_id,
@@ -133,24 +204,30 @@ class BinanceLiveDataClient(LiveMarketDataClient):
                 ask_price=ask_price,
                 bid_size=bid_qty,
                 ask_size=ask_qty,
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                ts_event=ts,
+                ts_init=ts,
             )
 
-            # Publish quote tick to message bus
-            # self._log.info(f"publish to data.quotes.{instrument_id.venue.value}.{instrument_id.symbol.value}")
-            self._msgbus.publish(topic=f"data.quotes.{instrument_id.venue.value}.{instrument_id.symbol.value}", msg=quote_tick)
+            ticks.append((topic, quote_tick))
 
         except Exception as e:
             self._log.error(f"Error handling Binance data: {e}")
 
+    def _publish_ticks(self, ticks: list[tuple[str, QuoteTick]]) -> None:
+        publish = self._msgbus.publish
+        for topic, quote_tick in ticks:
+            try:
+                publish(topic=topic, msg=quote_tick)
+            except Exception as e:
+                self._log.error(f"Error publishing tick on {topic}: {e}")
+
     async def _heartbeat(self) -> None:
         while True:
             try:
                 await asyncio.sleep(self._config.heartbeat_interval)
                 if self._websocket:
                     ping_msg = {"method": "ping"}
-                    await self._websocket.send(json.dumps(ping_msg))
+                    await self._websocket.send(orjson.dumps(ping_msg).decode())
                     self._log.debug("Sent heartbeat ping")
             except Exception as e:
                 self._log.error(f"Heartbeat error: {e}")
@@ -1,9 +1,7 @@
 import asyncio
-import json
-import ssl
-from typing import Any, Dict, Optional
+from typing import Optional
 
-import certifi
+import msgspec
 import websockets
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
@@ -16,9 +14,29 @@ from nautilus_trader.model.identifiers import InstrumentId, Venue, ClientId
 from nautilus_trader.model.objects import Price, Quantity
 
 from config import SYMBOLS, HYPERLIQUID_VENUE
+from tls import ssl_context
+
+TICK_QUEUE_SIZE = 4096
+
+# allMids snapshots for every listed coin stay well below this - anything bigger is malformed
+MAX_FRAME_SIZE = 8 * 2**20
+
+# constant payloads, serialized once (as str, so they still go out as text frames)
+SUBSCRIBE_ALL_MIDS_FRAME = msgspec.json.encode({"method": "subscribe", "subscription": {"type": "allMids"}}).decode()
+PING_FRAME = msgspec.json.encode({"method": "ping"}).decode()
+
+
+class AllMidsData(msgspec.Struct):
+    mids: dict[str, str] = {}
+    time: Optional[int] = None
+
+
+class HyperliquidMessage(msgspec.Struct):
+    # only allMids carries mids - other channels (subscriptionResponse, pong) decode with defaults,
+    # error frames carry the server's message as a plain string
+    channel: str
+    data: AllMidsData | str | None = None
 
-ssl_context = ssl.create_default_context()
-ssl_context.load_verify_locations(certifi.where())
 
 class HyperliquidLiveDataClientConfig(LiveDataClientConfig, frozen=True):
     websocket_url: str = "wss://api.hyperliquid.xyz/ws"
@@ -47,31 +65,73 @@ class HyperliquidLiveDataClient(LiveMarketDataClient):
         )
 
         self._config = config
-        self._websocket: Optional[websockets.WebSocketServerProtocol] = None
-        self._subscribed_symbols: set[str] = set()
+        self._websocket: Optional[websockets.ClientConnection] = None
         self._reconnect_task: Optional[asyncio.Task] = None
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
+        self._ping_task: Optional[asyncio.Task] = None
+        self._msg_task: Optional[asyncio.Task] = None
+        # decoded ticks waiting for the publisher task, so a slow msgbus.publish doesn't stall recv
+        self._tick_queue: asyncio.Queue[tuple[str, QuoteTick]] = asyncio.Queue(maxsize=TICK_QUEUE_SIZE)
+        self._publisher_task: Optional[asyncio.Task] = None
+        self._dropped_ticks = 0  # overflow count, reported once per publisher drain
+        self._zero_qty = Quantity.from_int(0)  # allMids carries no sizes
+        # last (mid string, parsed price) per symbol - most mids don't move between two allMids messages
+        self._last_mids: dict[str, tuple[str, Price]] = {}
+        self._decoder = msgspec.json.Decoder(HyperliquidMessage)
+
+        # instrument id and msgbus topic per symbol, so the tick path doesn't have to parse/format them
+        self._symbol_meta: dict[str, tuple[InstrumentId, str]] = {
+            symbol: (
+                InstrumentId.from_str(f"{symbol}.{HYPERLIQUID_VENUE}"),
+                f"data.quotes.{HYPERLIQUID_VENUE}.{symbol}",
+            )
+            for symbol in SYMBOLS
+        }
 
     async def _connect(self) -> None:
         try:
+            # a reconnect must not leave the previous connection's tasks running next to the new ones
+            await self._cancel_connection_tasks()
+
             self._log.info(f"Connecting to Hyperliquid WebSocket: {self._config.websocket_url}")
-            self._websocket = await websockets.connect(self._config.websocket_url, ssl=ssl_context)
+            # allMids frames are small and frequent - deflate costs more CPU than it saves
+            self._websocket = await websockets.connect(
+                self._config.websocket_url,
+                ssl=ssl_context,
+                compression=None,
+                max_size=MAX_FRAME_SIZE,
+            )
             self._log.info("Connected to Hyperliquid WebSocket")
 
             await self._subscribe_to_all_mids()
 
-            self._loop.create_task(self._handle_messages())
+            if not self._publisher_task:
+                self._publisher_task = self._loop.create_task(self._publisher_loop())
+
+            self._msg_task = self._loop.create_task(self._handle_messages())
 
             if self._config.heartbeat_interval > 0:
-                self._heartbeat_task = self._loop.create_task(self._heartbeat())
+                self._schedule_heartbeat()
 
         except Exception as e:
             self._log.error(f"Failed to connect to Hyperliquid WebSocket: {e}")
             raise
 
     async def _disconnect(self) -> None:
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        await self._cancel_connection_tasks()
+
+        if self._publisher_task:
+            self._publisher_task.cancel()
+            self._publisher_task = None
+
+        # ticks from this session must not be published as fresh quotes after the next connect
+        queue = self._tick_queue
+        while not queue.empty():
+            queue.get_nowait()
 
         if self._websocket:
             await self._websocket.close()
@@ -79,64 +139,91 @@ class HyperliquidLiveDataClient(LiveMarketDataClient):
 
         self._log.info("Disconnected from Hyperliquid WebSocket")
 
+    async def _cancel_connection_tasks(self) -> None:
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+
+        for task in (self._ping_task, self._msg_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        self._ping_task = None
+        self._msg_task = None
+
     async def _subscribe_to_all_mids(self) -> None:
         if not self._websocket:
             raise RuntimeError("WebSocket not connected")
 
-        subscribe_msg = {
-            "method": "subscribe",
-            "subscription": {
-                "type": "allMids"
-            }
-        }
-
-        await self._websocket.send(json.dumps(subscribe_msg))
+        await self._websocket.send(SUBSCRIBE_ALL_MIDS_FRAME)
         self._log.info("Subscribed to allMids feed")
 
     async def _handle_messages(self) -> None:
         try:
-            async for message in self._websocket:
-                await self._process_message(message)
+            # frames already buffered by the connection are handed out without suspending,
+            # so a burst is drained and processed in one go before yielding to the loop again;
+            # they're kept as raw bytes - msgspec decodes them directly, no intermediate str
+            websocket = self._websocket
+            while True:
+                self._process_message(await websocket.recv(decode=False))
         except websockets.exceptions.ConnectionClosed:
             self._log.warning("WebSocket connection closed")
+            # no pinging a dead socket during the reconnect backoff - _connect schedules a fresh heartbeat
+            if self._heartbeat_handle:
+                self._heartbeat_handle.cancel()
+                self._heartbeat_handle = None
             if not self._reconnect_task:
                 self._reconnect_task = self._loop.create_task(self._reconnect())
         except Exception as e:
             self._log.error(f"Error handling messages: {e}")
 
-    async def _process_message(self, message: str) -> None:
+    def _process_message(self, message: bytes) -> None:
         try:
-            data = json.loads(message)
+            msg = self._decoder.decode(message)
 
-            if data.get("channel") == "allMids" and "data" in data:
-                await self._handle_all_mids_data(data["data"])
+            if msg.channel == "allMids" and isinstance(msg.data, AllMidsData):
+                self._handle_all_mids_data(msg.data)
+            elif msg.channel == "error":
+                self._log.error(f"Hyperliquid error: {msg.data}")
 
         except Exception as e:
             self._log.error(f"Error processing message: {e}")
 
-    async def _handle_all_mids_data(self, data: Dict[str, Any]) -> None:
+    def _handle_all_mids_data(self, data: AllMidsData) -> None:
         try:
-            mids = data.get("mids", {})
-
-            for symbol_str, mid_price_str in mids.items():
+            mids = data.mids
+            if not mids:
+                return
+            ts_init = self._clock.timestamp_ns()
+            ts_event = data.time or ts_init
+
+            # allMids carries every listed coin - walk our (much smaller) symbol set and look each one up
+            for symbol_str, (instrument_id, topic) in self._symbol_meta.items():
                 try:
-                    if not symbol_str in SYMBOLS:
+                    mid_price_str = mids.get(symbol_str)
+                    if mid_price_str is None:
                         continue
-                    instrument_id = InstrumentId.from_str(symbol_str + "." + self.venue.value)
-                    price = Price.from_str(mid_price_str)
+                    last_mid = self._last_mids.get(symbol_str)
+                    if last_mid is not None and last_mid[0] == mid_price_str:
+                        price = last_mid[1]
+                    else:
+                        price = Price.from_str(mid_price_str)
+                        self._last_mids[symbol_str] = (mid_price_str, price)
 
                     quote_tick = QuoteTick(
                         instrument_id=instrument_id,
                         bid_price=price, # just mids..
                         ask_price=price, # just mids..
-                        bid_size=Quantity.from_int(0),  # Not provided in allMids
-                        ask_size=Quantity.from_int(0),  # Not provided in allMids
-                        ts_event=data.get("time", self._clock.timestamp_ns()),
-                        ts_init=self._clock.timestamp_ns(),
+                        bid_size=self._zero_qty,  # Not provided in allMids
+                        ask_size=self._zero_qty,  # Not provided in allMids
+                        ts_event=ts_event,
+                        ts_init=ts_init,
                     )
 
-                    # self._log.info(f"publish to data.quotes.{instrument_id.venue.value}.{instrument_id.symbol.value}")
-
                     # self._msgbus.publish(topic=f"data.quotes.${instrument_id}", msg=quote_tick)
                     # note: during the subscription to a topic, the order of symbol.venue seems to be changed to venue.symbol...because why not?
                     # not sure wtf is going on, for now - we need to adapt here
@@ -144,7 +231,7 @@ class HyperliquidLiveDataClient(LiveMarketDataClient):
                     # 2025-06-06T09:30:04.583491000Z [DEBUG] PPE-THE-TRADER-555.MessageBus: Added Subscription(topic=data.quotes.HYPERLIQUID.AVAXUSDT, handler=<bound method ArbitrageStrategy.handle_quote_tick of ArbitrageStrategy(ArbitrageStrategy-000)>, priority=0)
                     # 2025-06-06T09:30:04.583621000Z [INFO] PPE-THE-TRADER-555.ArbitrageStrategy: [CMD]--> SubscribeQuoteTicks(instrument_id=AVAXUSDT.HYPERLIQUID, client_id=JUST-PPE-STRATEGY, venue=HYPERLIQUID)
                     #
-                    self._msgbus.publish(topic=f"data.quotes.{instrument_id.venue.value}.{instrument_id.symbol.value}", msg=quote_tick)
+                    self._enqueue_tick(topic, quote_tick)
 
                 except Exception as e:
                     self._log.error(f"Error processing symbol {symbol_str}: {e}")
@@ -152,17 +239,49 @@ class HyperliquidLiveDataClient(LiveMarketDataClient):
         except Exception as e:
             self._log.error(f"Error handling allMids data: {e}")
 
-    async def _heartbeat(self) -> None:
+    def _enqueue_tick(self, topic: str, quote_tick: QuoteTick) -> None:
+        try:
+            self._tick_queue.put_nowait((topic, quote_tick))
+        except asyncio.QueueFull:
+            # publisher is lagging behind - the oldest tick is the least useful one
+            self._tick_queue.get_nowait()
+            self._tick_queue.put_nowait((topic, quote_tick))
+            # counted, not logged - a warning per tick would slow the overloaded loop down even more
+            self._dropped_ticks += 1
+
+    async def _publisher_loop(self) -> None:
+        queue = self._tick_queue
         while True:
-            try:
-                await asyncio.sleep(self._config.heartbeat_interval)
-                if self._websocket:
-                    ping_msg = {"method": "ping"}
-                    await self._websocket.send(json.dumps(ping_msg))
-                    self._log.debug("Sent heartbeat ping")
-            except Exception as e:
-                self._log.error(f"Heartbeat error: {e}")
-                break
+            topic, quote_tick = await queue.get()
+            while True:
+                try:
+                    self._msgbus.publish(topic=topic, msg=quote_tick)
+                except Exception as e:
+                    self._log.error(f"Error publishing tick on {topic}: {e}")
+
+                # drain whatever is already queued without waiting for another wakeup
+                if queue.empty():
+                    break
+                topic, quote_tick = queue.get_nowait()
+
+            if self._dropped_ticks:
+                self._log.warning(f"Tick queue full, dropped {self._dropped_ticks} oldest ticks")
+                self._dropped_ticks = 0
+
+    def _schedule_heartbeat(self) -> None:
+        self._heartbeat_handle = self._loop.call_later(self._config.heartbeat_interval, self._send_ping)
+
+    def _send_ping(self) -> None:
+        if self._websocket:
+            self._ping_task = self._loop.create_task(self._ping(self._websocket))
+        self._schedule_heartbeat()
+
+    async def _ping(self, websocket: websockets.ClientConnection) -> None:
+        try:
+            await websocket.send(PING_FRAME)
+            self._log.debug("Sent heartbeat ping")
+        except Exception as e:
+            self._log.error(f"Heartbeat error: {e}")
 
     async def _reconnect(self) -> None:
         backoff = 1
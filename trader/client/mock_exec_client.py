@@ -1,6 +1,8 @@
 import asyncio
+import functools
+import itertools
+import random
 import time
-import uuid
 
 from nautilus_trader.accounting.accounts.margin import MarginAccount
 from nautilus_trader.adapters.sandbox.config import SandboxExecutionClientConfig
@@ -15,11 +17,52 @@ from nautilus_trader.model.events import OrderAccepted, OrderFilled, OrderReject
 from nautilus_trader.model.functions import oms_type_from_str, account_type_from_str
 from nautilus_trader.model.identifiers import AccountId, ClientId, VenueOrderId, Venue, InstrumentId, Symbol, TradeId
 from nautilus_trader.model.instruments import CurrencyPair
-from nautilus_trader.model.objects import Money, Price, Currency, Quantity
+from nautilus_trader.model.objects import Money, Price, Currency, Quantity, FIXED_PRECISION
 from nautilus_trader.model.orders import Order
 
 from config import SYMBOLS
 
+USDT = Currency.from_str("USDT")
+
+# mock ids only have to be unique within the process - a counter is much cheaper than uuid4()
+_ids = itertools.count(1)
+
+# artificial delay between acceptance and fill, in seconds - 0 fills right after acceptance
+SIMULATED_FILL_LATENCY = 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _build_instruments(venue: Venue) -> tuple[CurrencyPair, ...]:
+    # instruments are immutable, so every client for the same venue can share them
+    now = time.time_ns()
+    instruments = []
+    for symbol in SYMBOLS:
+        instruments.append(CurrencyPair(
+            instrument_id=InstrumentId(Symbol(symbol), venue),
+            raw_symbol=Symbol(symbol),
+            base_currency=Currency.from_str(symbol),
+            quote_currency=USDT,
+            price_precision=4,
+            size_precision=4,
+            price_increment=Price.from_str("0.0001"),
+            size_increment=Quantity.from_str("0.0001"),
+            lot_size=None,
+            max_quantity=None,
+            min_quantity=Quantity.from_str("0.0001"),
+            max_notional=None,
+            min_notional=None,
+            max_price=None,
+            min_price=Price.from_str("0.0001"),
+            margin_init=Decimal("0.1"),
+            margin_maint=Decimal("0.05"),
+            maker_fee=Decimal("0.0002"),
+            taker_fee=Decimal("0.0005"),
+            ts_event=now,
+            ts_init=now,
+        ))
+
+    return tuple(instruments)
+
 
 class LoggingMockExecutionClient(ExecutionClient):
     def __init__(
@@ -45,40 +88,13 @@ class LoggingMockExecutionClient(ExecutionClient):
             config=config
         )
 
-        now = time.time_ns()
-        for symbol in SYMBOLS:
-            base_currency = Currency.from_str(symbol)
-            quote_currency = Currency.from_str("USDT")
-
-            instrument = CurrencyPair(
-                instrument_id=InstrumentId(Symbol(symbol), self.venue),
-                raw_symbol=Symbol(symbol),
-                base_currency=base_currency,
-                quote_currency=quote_currency,
-                price_precision=4,
-                size_precision=4,
-                price_increment=Price.from_str("0.0001"),
-                size_increment=Quantity.from_str("0.0001"),
-                lot_size=None,
-                max_quantity=None,
-                min_quantity=Quantity.from_str("0.0001"),
-                max_notional=None,
-                min_notional=None,
-                max_price=None,
-                min_price=Price.from_str("0.0001"),
-                margin_init=Decimal("0.1"),
-                margin_maint=Decimal("0.05"),
-                maker_fee=Decimal("0.0002"),
-                taker_fee=Decimal("0.0005"),
-                ts_event=now,
-                ts_init=now,
-            )
+        for instrument in _build_instruments(self.venue):
             self._cache.add_instrument(instrument)
 
         self._loop = loop
         self._config = config
 
-        self._account_id = AccountId(f"{self.venue}-MOCK-{uuid.uuid4().hex[:8]}")
+        self._account_id = AccountId(f"{self.venue}-MOCK-{random.getrandbits(32):08x}")
 
     def connect(self) -> None:
         self._set_connected(True)
@@ -102,28 +118,27 @@ class LoggingMockExecutionClient(ExecutionClient):
         try:
             order = command.order
 
-            self._log.info(f"MOCK {self.venue} EXEC: Received order submission")
-            self._log.info(f"  Order ID: {order.client_order_id}")
-            self._log.info(f"  Symbol: {order.instrument_id}")
-            self._log.info(f"  Side: {order.side}")
-            self._log.info(f"  Quantity: {order.quantity}")
-            self._log.info(f"  Type: {order.order_type.name}")
-
-            if hasattr(order, 'price') and order.price:
-                self._log.info(f"  Price: ${order.price}")
+            # one single-line log record per event - every Logger call crosses into the Rust logger
+            price = getattr(order, 'price', None)
+            self._log.info(
+                f"MOCK {self.venue} EXEC: Received order submission id={order.client_order_id} "
+                f"symbol={order.instrument_id} side={order.side.name} qty={order.quantity} "
+                f"type={order.order_type.name}"
+                + (f" price=${price}" if price else "")
+            )
 
             self._simulate_order_acceptance(order)
 
-            self._loop.create_task(self._simulate_order_fill(order))
+            if SIMULATED_FILL_LATENCY > 0:
+                self._loop.call_later(SIMULATED_FILL_LATENCY, self._simulate_order_fill, order)
+            else:
+                self._simulate_order_fill(order)
 
         except Exception as e:
             self._log.error(f"Error submitting order: {e}")
 
     def cancel_order(self, command: CancelOrder) -> None:
         try:
-            self._log.info(f"MOCK {self.venue} EXEC: Order cancellation requested")
-            self._log.info(f"  Order ID: {command.client_order_id}")
-
             self._log.info(f"MOCK {self.venue} EXEC: Order {command.client_order_id} canceled")
 
         except Exception as e:
@@ -131,22 +146,18 @@ class LoggingMockExecutionClient(ExecutionClient):
 
     def modify_order(self, command: ModifyOrder) -> None:
         try:
-            self._log.info(f"MOCK {self.venue} EXEC: Order modification requested")
-            self._log.info(f"  Order ID: {command.client_order_id}")
-
-            if command.quantity:
-                self._log.info(f"  New Quantity: {command.quantity}")
-            if command.price:
-                self._log.info(f"  New Price: ${command.price}")
-
-            self._log.info(f"MOCK {self.venue} EXEC: Order {command.client_order_id} modified")
+            self._log.info(
+                f"MOCK {self.venue} EXEC: Order {command.client_order_id} modified"
+                + (f" qty={command.quantity}" if command.quantity else "")
+                + (f" price=${command.price}" if command.price else "")
+            )
 
         except Exception as e:
             self._log.error(f"Error modifying order: {e}")
 
     def _simulate_order_acceptance(self, order: Order) -> None:
         try:
-            venue_order_id = VenueOrderId(f"${self.venue}-{uuid.uuid4().hex[:12].upper()}")
+            venue_order_id = VenueOrderId(f"{self.venue}-{next(_ids):012X}")
             event_id = UUID4()
 
             # Generate order accepted event
@@ -166,18 +177,12 @@ class LoggingMockExecutionClient(ExecutionClient):
             # self._msgbus.publish(event)
 
             self._log.info(f"MOCK {self.venue} EXEC: Order accepted {event}")
-            self._log.info(f"  Client Order ID: {order.client_order_id}")
-            self._log.info(f"  Venue Order ID: {venue_order_id}")
 
         except Exception as e:
             self._log.error(f"Error simulating order acceptance: {e}")
 
-    async def _simulate_order_fill(self, order: Order) -> None:
+    def _simulate_order_fill(self, order: Order) -> None:
         try:
-            await asyncio.sleep(0.1)
-
-            import random
-
             if random.random() < 0.05:
                 self._simulate_order_rejection(order)
                 return
@@ -209,8 +214,6 @@ class LoggingMockExecutionClient(ExecutionClient):
             #self._msgbus.publish(topic="data.events", msg=event)
 
             self._log.warning(f"MOCK {self.venue} EXEC: Order rejected {event}")
-            self._log.warning(f"  Order ID: {order.client_order_id}")
-            self._log.warning(f"  Reason: Insufficient margin (simulated)")
 
         except Exception as e:
             self._log.error(f"Error simulating order rejection: {e}")
@@ -218,17 +221,15 @@ class LoggingMockExecutionClient(ExecutionClient):
     def _simulate_order_fill_event(self, order: Order) -> None:
         try:
             # Simulate fill price (add some slippage)
-            import random
-
-            if hasattr(order, 'price') and order.price:
-                fill_price = order.price
-            else:
+            fill_price = getattr(order, 'price', None)
+            if not fill_price:
                 # For market orders, simulate current market price
                 fill_price = Price.from_str("50000.00")  # Mock price
 
-            # Add small amount of slippage (0.01-0.05%)
-            slippage_factor = 1 + (random.uniform(-0.0005, 0.0005))
-            fill_price = Price.from_str(str(float(fill_price) * slippage_factor))
+            # Add small amount of slippage (0.01-0.05%), on the raw fixed-point value rounded to the price precision
+            increment = 10 ** (FIXED_PRECISION - fill_price.precision)
+            slippage = round(fill_price.raw * random.uniform(-0.0005, 0.0005) / increment) * increment
+            fill_price = Price.from_raw(fill_price.raw + slippage, fill_price.precision)
 
             event = OrderFilled(
                 trader_id=order.trader_id,
@@ -238,12 +239,12 @@ class LoggingMockExecutionClient(ExecutionClient):
                 venue_order_id=VenueOrderId("venue-id"),
                 account_id=self._account_id,
                 position_id=order.position_id,
-                trade_id=TradeId(UUID4().value),
+                trade_id=TradeId(f"{self.venue}-T-{next(_ids):012X}"),
                 order_side=order.side,
                 order_type=order.order_type,
                 last_qty=order.quantity,
                 last_px=fill_price,
-                currency=Currency.from_str("USDT"),
+                currency=USDT,
                 commission=Money.from_str("0 USDT"),
                 liquidity_side=LiquiditySide.NO_LIQUIDITY_SIDE, # ??
                 event_id=UUID4(),
@@ -254,13 +255,10 @@ class LoggingMockExecutionClient(ExecutionClient):
 
             # self._msgbus.publish(event)
 
-            self._log.info(f"MOCK {self.venue} EXEC: Order filled {event}")
-            self._log.info(f"  Order ID: {order.client_order_id}")
-            self._log.info(f"  Trade ID: {event.trade_id}")
-            self._log.info(f"  Side: {order.side.name}")
-            self._log.info(f"  Quantity: {order.quantity}")
-            self._log.info(f"  Fill Price: ${fill_price}")
-            self._log.info(f"  Total Value: ${float(order.quantity) * float(fill_price):.2f}")
+            self._log.info(
+                f"MOCK {self.venue} EXEC: Order filled {event} "
+                f"value=${order.quantity.as_double() * fill_price.as_double():.2f}"
+            )
 
         except Exception as e:
             self._log.error(f"Error simulating order fill event: {e}")
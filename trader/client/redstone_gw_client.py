@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 
 import aiohttp
+import simdjson
 
 from nautilus_trader.common.component import LiveClock, MessageBus
 from nautilus_trader.live.data_client import LiveMarketDataClient
@@ -12,6 +13,32 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
 from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.model.objects import Price, Quantity, Currency
 
+from tls import ssl_context
+
+ONE_QTY = Quantity.from_str("1.0")
+EPS_PRICE = Price.from_str("0.00000001")
+EPS_QTY = Quantity.from_str("0.00000001")
+
+RESPONSE_BUFFER_SIZE = 1 << 20
+RESPONSE_CHUNK_SIZE = 1 << 16
+
+USDT = Currency.from_str("USDT")
+USD = Currency.from_str("USD")
+
+COMMON_SOURCES = (
+    "binance-usdt", "bitget-usdt", "bitmart-usdt", "kraken-usd",
+    "kucoin-usdt", "lbank-usdt", "okx-usdt", "bitfinex-usd",
+    "coinbase-usd", "uniswap-v3-ethereum-weth-3000"
+)
+
+# (source, venue, quote currency) - venue and quote currency are determined from the source name suffix
+SOURCE_TABLE = tuple(
+    (source, Venue(source[:-len("-usdt")].upper()), USDT) if source.endswith("-usdt")
+    else (source, Venue(source[:-len("-usd")].upper()), USD) if source.endswith("-usd")
+    else (source, Venue(source.upper()), USD)  # Default
+    for source in COMMON_SOURCES
+)
+
 
 class RestDataClientConfig(LiveMarketDataClient):
     """Configuration for REST API data client"""
@@ -31,6 +58,25 @@ class RestDataClientConfig(LiveMarketDataClient):
 
 
 class RedstoneGwClient:
+    __slots__ = (
+        "_loop",
+        "_msgbus",
+        "_cache",
+        "_clock",
+        "_config",
+        "_logger",
+        "_session",
+        "_is_connected",
+        "_is_running",
+        "_polling_task",
+        "_etag",
+        "_last_modified",
+        "_parser",
+        "_buffer",
+        "_instruments",
+        "_source_venues",
+    )
+
     def __init__(
             self,
             loop: asyncio.AbstractEventLoop,
@@ -51,42 +97,32 @@ class RedstoneGwClient:
         self._is_running = False
         self._polling_task: Optional[asyncio.Task] = None
 
+        # Validators of the last processed response, sent back so an unchanged payload comes back as 304
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+
+        # On-demand parser, reused across polls - only the fields we touch get materialized.
+        # Documents returned by it are invalidated by the next parse() call.
+        self._parser = simdjson.Parser()
+        # Response bodies are streamed into this buffer (grown on demand) instead of a fresh bytes object per poll
+        self._buffer = bytearray(RESPONSE_BUFFER_SIZE)
+
         # Track instruments for each venue/source
         self._instruments: Dict[str, Dict[str, CurrencyPair]] = {}
-        self._source_venues: Dict[str, Venue] = {}
+        self._source_venues: Dict[str, Venue] = {source: venue for source, venue, _ in SOURCE_TABLE}
 
         # Initialize instruments for all symbols and sources
         self._initialize_instruments()
 
     def _initialize_instruments(self):
-        common_sources = [
-            "binance-usdt", "bitget-usdt", "bitmart-usdt", "kraken-usd",
-            "kucoin-usdt", "lbank-usdt", "okx-usdt", "bitfinex-usd",
-            "coinbase-usd", "uniswap-v3-ethereum-weth-3000"
-        ]
-
+        ts = self._clock.timestamp_ns()
         for symbol in self._config.symbols:
             self._instruments[symbol] = {}
+            base_currency = Currency.from_str(symbol)
+            raw_symbol = Symbol(symbol)
 
-            for source in common_sources:
-                # Determine quote currency from source name
-                if source.endswith('-usdt'):
-                    quote_currency = Currency.from_str("USDT")
-                    venue_name = source.replace('-usdt', '').upper()
-                elif source.endswith('-usd'):
-                    quote_currency = Currency.from_str("USD")
-                    venue_name = source.replace('-usd', '').upper()
-                else:
-                    quote_currency = Currency.from_str("USD")  # Default
-                    venue_name = source.upper()
-
-                # Create venue
-                venue = Venue(venue_name)
-                self._source_venues[source] = venue
-
+            for source, venue, quote_currency in SOURCE_TABLE:
                 # Create instrument
-                base_currency = Currency.from_str(symbol)
-
                 instrument_id = InstrumentId(
                     symbol=Symbol(f"{symbol}/{quote_currency.code}"),
                     venue=venue
@@ -94,26 +130,26 @@ class RedstoneGwClient:
 
                 instrument = CurrencyPair(
                     instrument_id=instrument_id,
-                    raw_symbol=Symbol(symbol),
+                    raw_symbol=raw_symbol,
                     base_currency=base_currency,
                     quote_currency=quote_currency,
                     price_precision=8,
                     size_precision=8,
-                    price_increment=Price.from_str("0.00000001"),
-                    size_increment=Quantity.from_str("0.00000001"),
+                    price_increment=EPS_PRICE,
+                    size_increment=EPS_QTY,
                     lot_size=None,
                     max_quantity=None,
-                    min_quantity=Quantity.from_str("0.00000001"),
+                    min_quantity=EPS_QTY,
                     max_notional=None,
                     min_notional=None,
                     max_price=None,
-                    min_price=Price.from_str("0.00000001"),
+                    min_price=EPS_PRICE,
                     margin_init=Decimal("0.1"),
                     margin_maint=Decimal("0.05"),
                     maker_fee=Decimal("0.001"),
                     taker_fee=Decimal("0.001"),
-                    ts_event=self._clock.timestamp_ns(),
-                    ts_init=self._clock.timestamp_ns(),
+                    ts_event=ts,
+                    ts_init=ts,
                 )
 
                 self._instruments[symbol][source] = instrument
@@ -124,9 +160,10 @@ class RedstoneGwClient:
         try:
             self._logger.info("Connecting to REST API...")
 
-            # Create HTTP session
+            # Create HTTP session, reusing the shared TLS context and caching DNS across polls
             timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(ssl=ssl_context, limit=4, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
             # Test connection
             await self._fetch_data()
@@ -189,8 +226,11 @@ class RedstoneGwClient:
                 self._logger.error(f"Error in polling loop: {e}")
                 await asyncio.sleep(self._config.polling_interval)
 
-    async def _fetch_data(self) -> Dict[str, Any]:
-        """Fetch data from REST API"""
+    async def _fetch_data(
+            self,
+            conditional: bool = False
+    ) -> Optional[Tuple[memoryview, Optional[str], Optional[str]]]:
+        """Fetch raw data with its ETag and Last-Modified validators, None if a conditional request found it unchanged"""
         if not self._session:
             raise RuntimeError("HTTP session not initialized")
 
@@ -201,26 +241,62 @@ class RedstoneGwClient:
             'limit': 1  # Get latest data only
         }
 
-        async with self._session.get(self._config.api_url, params=params) as response:
+        headers = {}
+        if conditional:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+        async with self._session.get(self._config.api_url, params=params, headers=headers) as response:
+            if conditional and response.status == 304:
+                return None
+
             if response.status != 200:
                 raise RuntimeError(f"API request failed with status {response.status}")
 
-            return await response.json()
+            buffer = self._buffer
+            size = 0
+            async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+                end = size + len(chunk)
+                buffer[size:end] = chunk  # extends the buffer if the body outgrows it
+                size = end
+
+            # Only valid until the next fetch - the parser copies it, so release it right after parsing
+            return (
+                memoryview(buffer)[:size],
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+            )
 
     async def _fetch_and_process_data(self):
         """Fetch data and process for arbitrage opportunities"""
         try:
-            data = await self._fetch_data()
+            fetched = await self._fetch_data(conditional=True)
+            if fetched is None:
+                self._logger.debug("Data unchanged since last poll")
+                return
+
+            raw, etag, last_modified = fetched
 
-            # Process each symbol's data
-            for symbol, symbol_data in data.items():
-                if symbol in self._config.symbols and symbol_data:
-                    await self._process_symbol_data(symbol, symbol_data)
+            with raw:
+                data = self._parser.parse(raw)
+
+            # Process each symbol's data (items() would materialize every value, so index lazily)
+            for symbol in data.keys():
+                if symbol in self._config.symbols:
+                    symbol_data = data[symbol]
+                    if symbol_data:
+                        await self._process_symbol_data(symbol, symbol_data)
+
+            # Only now is the payload fully processed - a failure above must not turn the next polls into 304s
+            self._etag = etag
+            self._last_modified = last_modified
 
         except Exception as e:
             self._logger.error(f"Error fetching and processing data: {e}")
 
-    async def _process_symbol_data(self, symbol: str, symbol_data: List[Dict[str, Any]]):
+    async def _process_symbol_data(self, symbol: str, symbol_data: simdjson.Array):
         """Process data for a specific symbol"""
         if not symbol_data:
             return
@@ -238,11 +314,11 @@ class RedstoneGwClient:
 
         source_metadata = data_point['metadata']['sourceMetadata']
 
-        # Extract prices from all sources
-        source_prices = self._extract_source_prices(source_metadata)
+        # Extract prices from the sources we have instruments for - only those can be quoted
+        source_prices = self._extract_source_prices(source_metadata, self._instruments[symbol])
 
         if len(source_prices) < 2:
-            self._logger.debug(f"Not enough price sources for {symbol}: {len(source_prices)}")
+            self._logger.debug("Not enough price sources for %s: %d", symbol, len(source_prices))
             return
 
         # Find arbitrage opportunities
@@ -252,32 +328,41 @@ class RedstoneGwClient:
         for opportunity in arbitrage_opportunities:
             await self._publish_arbitrage_opportunity(symbol, opportunity)
 
-    def _extract_source_prices(self, source_metadata: Dict[str, Any]) -> Dict[str, float]:
-        """Extract prices from source metadata"""
+    def _extract_source_prices(
+            self,
+            source_metadata: simdjson.Object,
+            instruments: Dict[str, CurrencyPair]
+    ) -> Dict[str, float]:
+        """Extract prices from source metadata for the sources in instruments"""
         source_prices = {}
 
-        for source, data in source_metadata.items():
+        for source in source_metadata.keys():
+            if source not in instruments:
+                continue
             try:
+                data = source_metadata[source]
+                # Every `in` + `[]` pair is two lookups on the simdjson tape, so use a single get() each
                 # Try to get price from 'value' field
-                if 'value' in data:
-                    price = float(data['value'])
-                    source_prices[source] = price
+                value = data.get('value')
+                if value is not None:
+                    source_prices[source] = float(value)
+                    continue
+
                 # Try to get price from tradeInfo
-                elif 'tradeInfo' in data:
-                    trade_info = data['tradeInfo']
-                    if 'bidPrice' in trade_info and 'askPrice' in trade_info:
+                trade_info = data.get('tradeInfo')
+                if trade_info is not None:
+                    bid = trade_info.get('bidPrice')
+                    ask = trade_info.get('askPrice')
+                    if bid is not None and ask is not None:
                         # Use mid price
-                        bid = float(trade_info['bidPrice'])
-                        ask = float(trade_info['askPrice'])
-                        mid_price = (bid + ask) / 2
-                        source_prices[source] = mid_price
-                    elif 'bidPrice' in trade_info:
-                        source_prices[source] = float(trade_info['bidPrice'])
-                    elif 'askPrice' in trade_info:
-                        source_prices[source] = float(trade_info['askPrice'])
+                        source_prices[source] = (float(bid) + float(ask)) / 2
+                    elif bid is not None:
+                        source_prices[source] = float(bid)
+                    elif ask is not None:
+                        source_prices[source] = float(ask)
 
             except (ValueError, KeyError, TypeError) as e:
-                self._logger.debug(f"Could not extract price from {source}: {e}")
+                self._logger.debug("Could not extract price from %s: %s", source, e)
                 continue
 
         return source_prices
@@ -287,43 +372,27 @@ class RedstoneGwClient:
             symbol: str,
             source_prices: Dict[str, float]
     ) -> List[Tuple[str, str, float, float, float]]:
-        """Find arbitrage opportunities between sources"""
+        """Find the widest arbitrage opportunity between sources"""
         opportunities = []
 
-        # Compare all pairs of sources
-        sources = list(source_prices.keys())
-
-        for i in range(len(sources)):
-            for j in range(i + 1, len(sources)):
-                source1, source2 = sources[i], sources[j]
-                price1, price2 = source_prices[source1], source_prices[source2]
-
-                # Calculate price difference percentage
-                min_price = min(price1, price2)
-                max_price = max(price1, price2)
-
-                if min_price > 0:
-                    price_diff_pct = (max_price - min_price) / min_price
-
-                    if price_diff_pct >= self._config.profit_threshold:
-                        # Determine buy/sell sources
-                        if price1 < price2:
-                            buy_source, sell_source = source1, source2
-                            buy_price, sell_price = price1, price2
-                        else:
-                            buy_source, sell_source = source2, source1
-                            buy_price, sell_price = price2, price1
-
-                        opportunities.append((
-                            buy_source, sell_source, buy_price, sell_price, price_diff_pct
-                        ))
-
-                        self._logger.info(
-                            f"Arbitrage opportunity found for {symbol}: "
-                            f"Buy at {buy_source} @ {buy_price:.6f}, "
-                            f"Sell at {sell_source} @ {sell_price:.6f}, "
-                            f"Profit: {price_diff_pct:.2%}"
-                        )
+        # The widest spread is always between the cheapest and the most expensive source
+        buy_source = min(source_prices, key=source_prices.__getitem__)
+        sell_source = max(source_prices, key=source_prices.__getitem__)
+        buy_price, sell_price = source_prices[buy_source], source_prices[sell_source]
+
+        if buy_price > 0:
+            price_diff_pct = (sell_price - buy_price) / buy_price
+
+            if price_diff_pct >= self._config.profit_threshold:
+                opportunities.append((
+                    buy_source, sell_source, buy_price, sell_price, price_diff_pct
+                ))
+
+                # lazy %-formatting - nothing is formatted when INFO is filtered out
+                self._logger.info(
+                    "Arbitrage opportunity found for %s: Buy at %s @ %.6f, Sell at %s @ %.6f, Profit: %.2f%%",
+                    symbol, buy_source, buy_price, sell_source, sell_price, price_diff_pct * 100
+                )
 
         return opportunities
 
@@ -345,10 +414,10 @@ class RedstoneGwClient:
 
                 buy_quote = QuoteTick(
                     instrument_id=buy_instrument.id,
-                    bid_price=Price.from_str(str(buy_price * 0.9995)),  # Slightly lower bid
-                    ask_price=Price.from_str(str(buy_price)),
-                    bid_size=Quantity.from_str("1.0"),
-                    ask_size=Quantity.from_str("1.0"),
+                    bid_price=Price(buy_price * 0.9995, buy_instrument.price_precision),  # Slightly lower bid
+                    ask_price=Price(buy_price, buy_instrument.price_precision),
+                    bid_size=ONE_QTY,
+                    ask_size=ONE_QTY,
                     ts_event=timestamp,
                     ts_init=timestamp,
                 )
@@ -363,10 +432,10 @@ class RedstoneGwClient:
 
                 sell_quote = QuoteTick(
                     instrument_id=sell_instrument.id,
-                    bid_price=Price.from_str(str(sell_price)),
-                    ask_price=Price.from_str(str(sell_price * 1.0005)),  # Slightly higher ask
-                    bid_size=Quantity.from_str("1.0"),
-                    ask_size=Quantity.from_str("1.0"),
+                    bid_price=Price(sell_price, sell_instrument.price_precision),
+                    ask_price=Price(sell_price * 1.0005, sell_instrument.price_precision),  # Slightly higher ask
+                    bid_size=ONE_QTY,
+                    ask_size=ONE_QTY,
                     ts_event=timestamp,
                     ts_init=timestamp,
                 )
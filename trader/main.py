@@ -16,6 +16,11 @@ from client.hyperliquid_client import (
 from config import BINANCE_VENUE, HYPERLIQUID_VENUE
 from client.mock_exec_client import MockExecClientFactory
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 
 async def main():
     print("=" * 60)
@@ -104,6 +109,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # the data clients run on the loop handed over by the node, so uvloop has to be installed before it is created
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,7 @@
+import ssl
+
+import certifi
+
+# One TLS context (with the certifi CA bundle loaded once) shared by every client.
+ssl_context = ssl.create_default_context()
+ssl_context.load_verify_locations(certifi.where())